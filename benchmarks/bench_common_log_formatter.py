@@ -0,0 +1,44 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+
+Compare per-record cost of logging.Formatter and CommonLogFormatter
+
+    python benchmarks/bench_common_log_formatter.py
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import logging
+import timeit
+
+from wollwo_common.common_logging import CommonLogFormatter
+from wollwo_common.common_logging.common_logger import DEFAULT_TEXT_FORMAT, DEFAULT_DATE_FORMAT
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+NUMBER: int = 200_000
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+def bench(formatter: logging.Formatter) -> float:
+    """
+    Returns:
+        float: nanoseconds per formatted record
+    """
+    record = logging.LogRecord('bench', logging.INFO, __file__, 1, 'Bench.method: value %d', (5,), None)
+    seconds = min(timeit.repeat(lambda: formatter.format(record), number=NUMBER, repeat=5))
+    return seconds / NUMBER * 1e9
+
+
+def main() -> None:
+    """run benchmark and print results"""
+    stdlib = bench(logging.Formatter(DEFAULT_TEXT_FORMAT, DEFAULT_DATE_FORMAT))
+    compiled = bench(CommonLogFormatter(DEFAULT_TEXT_FORMAT, DEFAULT_DATE_FORMAT))
+
+    print(f'logging.Formatter:  {stdlib:8.1f} ns/record')
+    print(f'CommonLogFormatter: {compiled:8.1f} ns/record ({stdlib / compiled:.2f}x)')
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    main()
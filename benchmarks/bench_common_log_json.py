@@ -0,0 +1,66 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+
+Compare per-record cost of CommonLogJsonFormatter, json.dumps of record fields
+and text CommonLogFormatter
+
+    python benchmarks/bench_common_log_json.py
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import json
+import logging
+import timeit
+
+from wollwo_common.common_logging import CommonLogFormatter, CommonLogJsonFormatter
+from wollwo_common.common_logging.common_logger import DEFAULT_TEXT_FORMAT, DEFAULT_DATE_FORMAT
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+NUMBER: int = 200_000
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+class JsonDumpsFormatter(logging.Formatter):
+    """Straightforward JSON formatter, one json.dumps() per record"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({
+            'ts': self.formatTime(record, self.datefmt),
+            'level': record.levelname,
+            'name': record.name,
+            'qualname': getattr(record, 'qualname', None),
+            'msg': record.getMessage(),
+            'request_id': getattr(record, 'request_id', None),
+        })
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+def bench(formatter: logging.Formatter) -> float:
+    """
+    Returns:
+        float: nanoseconds per formatted record
+    """
+    record = logging.LogRecord('bench', logging.INFO, __file__, 1, 'value %d', (5,), None)
+    record.qualname = 'Bench.method'
+    record.request_id = 'a1b2c3'
+    seconds = min(timeit.repeat(lambda: formatter.format(record), number=NUMBER, repeat=5))
+    return seconds / NUMBER * 1e9
+
+
+def main() -> None:
+    """run benchmark and print results"""
+    results = {
+        'CommonLogFormatter (text)': bench(CommonLogFormatter(DEFAULT_TEXT_FORMAT, DEFAULT_DATE_FORMAT)),
+        'json.dumps per record': bench(JsonDumpsFormatter(datefmt=DEFAULT_DATE_FORMAT)),
+        'CommonLogJsonFormatter': bench(CommonLogJsonFormatter(datefmt=DEFAULT_DATE_FORMAT)),
+    }
+
+    for name, nanoseconds in results.items():
+        print(f'{name:28} {nanoseconds:8.1f} ns/record')
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    main()
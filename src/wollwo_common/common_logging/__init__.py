@@ -5,4 +5,9 @@ License: MIT
 """
 
 from .common_log_line import CommonLogLineBase
+from .common_log_async import AsyncCommonLogLine
 from .common_logger import common_logger
+from .common_log_batch import CommonLogBatchHandler
+from .common_log_formatter import CommonLogFormatter
+from .common_log_json import CommonLogJsonFormatter
+from .common_log_queue import CommonLogQueueHandler
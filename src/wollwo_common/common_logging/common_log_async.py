@@ -0,0 +1,129 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import asyncio
+import logging
+
+from dataclasses import dataclass, field
+from typing import Optional, Callable
+
+from .common_log_line import CommonLogLineBase
+from .common_log_queue import CommonLogQueueHandler
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+__all__ = (
+    'AsyncCommonLogLine'
+)
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+@dataclass
+class AsyncCommonLogLine(CommonLogLineBase):
+    """
+    CommonLogLineBase for asyncio code, logger always runs in async mode
+
+    Records are handed over to queue drained by writer thread (CommonLogQueueHandler),
+    event loop never waits for output. With overflow 'block' full queue is awaited
+    in worker thread instead of blocking loop.
+
+    Drain queue on shutdown with "await drain()" or by using instance as async context manager
+
+        async with AsyncCommonLogLine('service') as log:
+            await log.ainfo('started', 'main')
+
+    Exceptions:
+        ValueError: raised by __post_init__() if logger_async is False
+    """
+    logger_async: bool = field(default=True)
+
+    #: Not visible
+    __queue_handler: Optional[CommonLogQueueHandler] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Post init tasks"""
+
+        if not self.logger_async:
+            raise ValueError(f"Expected 'logger_async' to be True for {self.__class__.__name__}")
+
+        super().__post_init__()
+
+        return
+
+    async def __aenter__(self):
+        """Enter async context manager"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        """Drain queued records"""
+        await self.drain()
+
+    def init_logger(self) -> None:
+        """initialize logger and find its queue handler"""
+        super().init_logger()
+
+        for handler in self.logger.handlers:
+            if isinstance(handler, CommonLogQueueHandler):
+                self.__queue_handler = handler
+                break
+
+    async def drain(self) -> None:
+        """wait in worker thread until all queued records are written"""
+        await asyncio.to_thread(self.__queue_handler.flush)
+
+    async def __wait_for_space(self) -> None:
+        """await free space in full queue, only for 'block' overflow policy"""
+        handler = self.__queue_handler
+        if handler.overflow == 'block' and handler.queued >= handler.max_size:
+            await asyncio.to_thread(handler.wait_for_space)
+
+    async def adebug(self, text: str | Callable[[], str], qualname: str | None = None, *args, **extra) -> None:
+        """
+        log provided text as debug line without blocking event loop, see CommonLogLineBase.debug
+        """
+        if self.is_enabled_for(logging.DEBUG):
+            await self.__wait_for_space()
+            self._log(logging.DEBUG, text, qualname, args, extra)
+
+    async def ainfo(self, text: str | Callable[[], str], qualname: str | None = None, *args, **extra) -> None:
+        """
+        log provided text as info line without blocking event loop, see CommonLogLineBase.info
+        """
+        if self.is_enabled_for(logging.INFO):
+            await self.__wait_for_space()
+            self._log(logging.INFO, text, qualname, args, extra)
+
+    async def awarning(self, text: str | Callable[[], str], qualname: str | None = None, *args, **extra) -> None:
+        """
+        log provided text as warning line without blocking event loop, see CommonLogLineBase.warning
+        """
+        if self.is_enabled_for(logging.WARNING):
+            await self.__wait_for_space()
+            self._log(logging.WARNING, text, qualname, args, extra)
+
+    async def aerror(self, text: str | Callable[[], str], qualname: str | None = None, *args, **extra) -> None:
+        """
+        log provided text as error line without blocking event loop, see CommonLogLineBase.error
+        """
+        if self.is_enabled_for(logging.ERROR):
+            await self.__wait_for_space()
+            self._log(logging.ERROR, text, qualname, args, extra)
+
+    async def acritical(self, text: str | Callable[[], str], qualname: str | None = None, *args, **extra) -> None:
+        """
+        log provided text as critical line without blocking event loop, see CommonLogLineBase.critical
+        """
+        if self.is_enabled_for(logging.CRITICAL):
+            await self.__wait_for_space()
+            self._log(logging.CRITICAL, text, qualname, args, extra)
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
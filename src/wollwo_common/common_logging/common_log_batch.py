@@ -0,0 +1,189 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import logging
+import os
+import sys
+import threading
+import time
+
+from logging import Handler, LogRecord
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+__all__ = (
+    'CommonLogBatchHandler',
+    'write_all',
+)
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+class CommonLogBatchHandler(Handler):
+    """
+    Handler collecting encoded lines in preallocated buffer, buffer is written
+    to file descriptor with single system call when:
+      - buffer is full
+      - flush_interval elapsed since last write (checked on emit and by timer thread)
+      - record of flush_level or higher is handled
+
+    Buffer is flushed by logging.shutdown() at interpreter exit.
+
+    Exceptions:
+        TypeError, ValueError: raised by __init__() on wrong arguments
+    """
+
+    def __init__(
+            self,
+            fd: int | None = None,
+            buffer_size: int = 64 * 1024,
+            flush_interval: float | None = 1.0,
+            flush_level: int = logging.ERROR,
+            encoding: str = 'utf-8',
+            level: int = logging.NOTSET
+    ):
+        """
+        Parameters:
+            fd (int):
+                file descriptor to write to, defaults to file descriptor of sys.stdout
+            buffer_size (int):
+                size of preallocated buffer in bytes
+            flush_interval (float):
+                maximum time in seconds for line to wait in buffer, None disables timer
+            flush_level (int):
+                records of this level or higher are written immediately
+            encoding (str):
+                encoding of lines
+            level (int):
+                level of handler
+        """
+        super().__init__(level)
+
+        if fd is None:
+            fd = sys.stdout.fileno()
+        if not isinstance(fd, int) or isinstance(fd, bool):
+            raise TypeError(f'Expected "fd" to be of type "int", got {type(fd).__name__}')
+        if not isinstance(buffer_size, int) or buffer_size < 1:
+            raise ValueError(f'Expected "buffer_size" to be int greater than 0, got {buffer_size!r}')
+        if flush_interval is not None and (not isinstance(flush_interval, (int, float)) or flush_interval <= 0):
+            raise ValueError(f'Expected "flush_interval" to be number greater than 0 or None, got {flush_interval!r}')
+
+        self.fd = fd
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self.encoding = encoding
+
+        self.__buffer = bytearray(buffer_size)
+        self.__view = memoryview(self.__buffer)
+        self.__position: int = 0
+        self.__last_flush: float = time.monotonic()
+
+        self.__stopped = threading.Event()
+        self.__thread: threading.Thread | None = None
+        if flush_interval is not None:
+            self.__thread = threading.Thread(
+                target=self.__run, name=f'{self.__class__.__name__}-timer', daemon=True
+            )
+            self.__thread.start()
+
+    @property
+    def buffered(self) -> int:
+        """count of bytes waiting in buffer"""
+        return self.__position
+
+    def emit(self, record: LogRecord) -> None:
+        """encode record to buffer, write buffer if needed"""
+
+        try:
+            data = (self.format(record) + '\n').encode(self.encoding)
+            size = len(data)
+            position = self.__position
+            capacity = len(self.__buffer)
+
+            if position + size <= capacity:
+                self.__view[position:position + size] = data
+                self.__position = position + size
+            elif size > capacity:
+                #: line does not fit to buffer, write it together with buffered lines
+                write_all(self.fd, self.__view[:position], data)
+                self.__position = 0
+                self.__last_flush = time.monotonic()
+            else:
+                write_all(self.fd, self.__view[:position])
+                self.__view[:size] = data
+                self.__position = size
+                self.__last_flush = time.monotonic()
+
+            if record.levelno >= self.flush_level or (
+                    self.flush_interval is not None
+                    and time.monotonic() - self.__last_flush >= self.flush_interval
+            ):
+                self.__flush()
+        except Exception:
+            self.handleError(record)
+
+    def __flush(self) -> None:
+        """write buffer, caller holds handler lock"""
+        if self.__position:
+            write_all(self.fd, self.__view[:self.__position])
+            self.__position = 0
+        self.__last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """write buffered lines"""
+        self.acquire()
+        try:
+            self.__flush()
+        finally:
+            self.release()
+
+    def __run(self) -> None:
+        """timer thread, writes buffer when flush_interval elapsed without writing"""
+        while not self.__stopped.wait(self.flush_interval):
+            if self.__position and time.monotonic() - self.__last_flush >= self.flush_interval:
+                try:
+                    self.flush()
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        """write buffered lines and stop timer thread, file descriptor is not closed"""
+        self.__stopped.set()
+        if self.__thread is not None and threading.current_thread() is not self.__thread:
+            self.__thread.join()
+        self.flush()
+        super().close()
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+def write_all(fd: int, *chunks) -> None:
+    """
+    write all chunks to file descriptor, with single os.writev() call where possible
+
+    Args:
+        fd (int): file descriptor
+        *chunks (bytes|memoryview): data to write
+    """
+    views = [memoryview(chunk) for chunk in chunks if len(chunk)]
+
+    while views:
+        if hasattr(os, 'writev'):
+            written = os.writev(fd, views)
+        else:
+            written = os.write(fd, views[0])
+
+        #: drop written data, handle partial writes
+        while written and views:
+            if written >= len(views[0]):
+                written -= len(views[0])
+                views.pop(0)
+            else:
+                views[0] = views[0][written:]
+                written = 0
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
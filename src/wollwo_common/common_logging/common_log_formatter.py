@@ -0,0 +1,175 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import logging
+import re
+import time
+
+from logging import LogRecord
+from typing import Callable, Optional
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+__all__ = (
+    'CommonLogFormatter',
+    'compile_log_format',
+)
+
+#: same fields as accepted by logging.PercentStyle
+_FIELD_PATTERN = re.compile(r'%\((?P<name>\w+)\)(?P<spec>[#0+ -]*(?:\*|\d+)?(?:\.(?:\*|\d+))?[diouxefgcrsa%])', re.I)
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+class CommonLogFormatter(logging.Formatter):
+    """
+    logging.Formatter with format compiled once to specialized render function
+
+    Output is the same as of logging.Formatter with '%' style, but per record
+    there is no template parsing and time.strftime() is called at most once per second.
+
+    Formats in '{' and '$' style are handled by logging.Formatter.
+    """
+
+    def __init__(
+            self,
+            fmt: Optional[str] = None,
+            datefmt: Optional[str] = None,
+            style: str = '%',
+            validate: bool = True
+    ):
+        """
+        Parameters:
+            fmt (str): format of logged line, as in logging.Formatter
+            datefmt (str): format of %(asctime)s, as in logging.Formatter
+            style (str): one of ['%', '{', '$']
+            validate (bool): validate format, as in logging.Formatter
+        """
+        super().__init__(fmt, datefmt, style, validate)
+
+        self.__render: Optional[Callable] = None
+        self.__uses_time: bool = False
+        self.__time_cache: tuple = (None, '')
+
+        if style == '%':
+            self.__render, fields = compile_log_format(self._fmt)
+            self.__uses_time = 'asctime' in fields
+
+    def usesTime(self) -> bool:
+        """check if format uses %(asctime)s"""
+        if self.__render is None:
+            return super().usesTime()
+        return self.__uses_time
+
+    def formatTime(self, record: LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        format creation time of record, rendered string is cached per second
+
+        Returns:
+            str
+        """
+        seconds = int(record.created)
+        cached_seconds, text = self.__time_cache
+
+        if cached_seconds != seconds:
+            text = time.strftime(datefmt or self.default_time_format, self.converter(seconds))
+            self.__time_cache = (seconds, text)
+
+        if datefmt is None and self.default_msec_format:
+            text = self.default_msec_format % (text, record.msecs)
+
+        return text
+
+    def format(self, record: LogRecord) -> str:
+        """
+        format record with compiled render function
+
+        Returns:
+            str
+        """
+        if self.__render is None:
+            return super().format(record)
+
+        record.message = message = record.getMessage()
+        if self.__uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+
+        try:
+            text = self.__render(record, message, record.__dict__.get('asctime'))
+        except AttributeError as error:
+            raise ValueError(f'Formatting field not found in record: {error}')
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if text[-1:] != '\n':
+                text += '\n'
+            text += record.exc_text
+        if record.stack_info:
+            if text[-1:] != '\n':
+                text += '\n'
+            text += self.formatStack(record.stack_info)
+
+        return text
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+def compile_log_format(fmt: str) -> tuple[Callable[[LogRecord, str, Optional[str]], str], frozenset]:
+    """
+    compile '%' style logging format to function render(record, message, asctime) -> str
+
+    Args:
+        fmt (str): format as in logging.Formatter, e.g. '%(asctime)s; %(name)s; %(message)s'
+    Returns:
+        tuple: (render function, frozenset of used field names)
+    """
+    if not isinstance(fmt, str):
+        raise TypeError(f'Provided argument "fmt" is not str, provided: {type(fmt)}')
+
+    namespace: dict = {}
+    parts: list = []
+    fields: set = set()
+    position = 0
+
+    def add_literal(literal: str) -> None:
+        if literal:
+            key = f'_literal_{len(namespace)}'
+            namespace[key] = literal.replace('%%', '%')
+            parts.append('{' + key + '}')
+
+    for match in _FIELD_PATTERN.finditer(fmt):
+        add_literal(fmt[position:match.start()])
+        position = match.end()
+
+        name, spec = match.group('name'), match.group('spec')
+        fields.add(name)
+
+        if name == 'message':
+            value = 'message'
+        elif name == 'asctime':
+            value = 'asctime'
+        else:
+            value = f'record.{name}'
+
+        if spec == 's':
+            parts.append('{' + value + '}')
+        elif spec in ('r', 'a'):
+            parts.append('{' + value + '!' + spec + '}')
+        else:
+            key = f'_spec_{len(namespace)}'
+            namespace[key] = f'%{spec}'
+            parts.append('{' + key + ' % (' + value + ',)}')
+
+    add_literal(fmt[position:])
+
+    source = f"def render(record, message, asctime):\n    return f'{''.join(parts)}'\n"
+    exec(compile(source, f'<compiled log format {fmt!r}>', 'exec'), namespace)
+
+    return namespace['render'], frozenset(fields)
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
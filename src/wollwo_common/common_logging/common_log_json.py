@@ -0,0 +1,135 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import json
+
+from itertools import islice
+from json.encoder import encode_basestring
+from logging import LogRecord
+from typing import Optional
+
+from .common_log_formatter import CommonLogFormatter
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+__all__ = (
+    'CommonLogJsonFormatter',
+)
+
+#: attributes of every LogRecord, anything added after them is extra field
+_RECORD_ATTRIBUTES: tuple = tuple(LogRecord('', 0, '', 0, '', None, None).__dict__)
+_RESERVED: frozenset = frozenset(_RECORD_ATTRIBUTES) | {'message', 'asctime', 'qualname'}
+_RECORD_SIZE: int = len(_RECORD_ATTRIBUTES)
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+class CommonLogJsonFormatter(CommonLogFormatter):
+    """
+    Formatter rendering records as JSON lines
+
+        {"ts": "...", "level": "INFO", "name": "...", "qualname": "...", "msg": "...", <extra fields>}
+
+    "qualname" is present only if record has it (CommonLogLineBase with logger_json=True),
+    extra fields are attributes added to record by logging "extra" argument.
+    Escaped timestamp (per second) and level with logger name are cached,
+    strings are escaped by C encoder of json library.
+    """
+
+    def __init__(self, datefmt: Optional[str] = None):
+        """
+        Parameters:
+            datefmt (str): format of "ts" value, as in logging.Formatter
+        """
+        super().__init__('%(message)s', datefmt)
+
+        self.__prefixes: dict = {}
+        self.__time: tuple = (None, '')
+
+    @staticmethod
+    def encode_value(value) -> str:
+        """
+        encode value of extra field to JSON
+
+        Returns:
+            str
+        """
+        if isinstance(value, str):
+            return encode_basestring(value)
+        if value is None:
+            return 'null'
+        if value is True:
+            return 'true'
+        if value is False:
+            return 'false'
+        if type(value) is int:
+            return str(value)
+        return json.dumps(value, default=str)
+
+    def __prefix(self, record: LogRecord) -> str:
+        """
+        render and cache part of line with level and logger name
+
+        Returns:
+            str
+        """
+        prefix = (
+            f',"level":{encode_basestring(record.levelname)},"name":{encode_basestring(record.name)}'
+        )
+        self.__prefixes.setdefault(record.name, {})[record.levelno] = prefix
+        return prefix
+
+    def format(self, record: LogRecord) -> str:
+        """
+        format record as single JSON line
+
+        Returns:
+            str
+        """
+        attributes = record.__dict__
+        has_extra = len(attributes) > _RECORD_SIZE
+        record.message = message = record.getMessage()
+
+        #: escaped timestamp is cached per second, unless milliseconds are part of it
+        seconds = int(record.created)
+        cached_seconds, ts = self.__time
+        if cached_seconds != seconds or self.datefmt is None:
+            ts = encode_basestring(self.formatTime(record, self.datefmt))
+            self.__time = (seconds, ts)
+
+        #: precomputed part with level and logger name
+        try:
+            prefix = self.__prefixes[record.name][record.levelno]
+        except KeyError:
+            prefix = self.__prefix(record)
+
+        qualname = attributes.get('qualname')
+        if qualname is None:
+            text = f'{{"ts":{ts}{prefix},"msg":{encode_basestring(message)}'
+        else:
+            text = f'{{"ts":{ts}{prefix},"qualname":{encode_basestring(qualname)},"msg":{encode_basestring(message)}'
+
+        #: extra fields, only records with extra attributes pay for this
+        if has_extra:
+            for key, value in islice(attributes.items(), _RECORD_SIZE, None):
+                if key not in _RESERVED:
+                    text += f',{encode_basestring(key)}:{self.encode_value(value)}'
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            text += f',"exc":{encode_basestring(record.exc_text)}'
+        if record.stack_info:
+            text += f',"stack":{encode_basestring(self.formatStack(record.stack_info))}'
+
+        return text + '}'
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
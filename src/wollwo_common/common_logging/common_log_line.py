@@ -8,9 +8,9 @@ License: MIT
 import logging
 
 from dataclasses import dataclass, field, fields, asdict, MISSING
-from typing import Optional
+from typing import Optional, Callable
 
-from .common_logger import common_logger
+from .common_logger import common_logger, DEFAULT_TEXT_FORMAT, DEFAULT_DATE_FORMAT
 
 #: ----------------------------------------------- VARIABLES -----------------------------------------------
 __all__ = (
@@ -24,8 +24,13 @@ class CommonLogLineBase:
     """Reusable wollwo-common class handling logging"""
     logger_name: str
     logger_level: str = field(default='INFO')
-    logger_text_format: str = field(default='%(asctime)s; %(name)s; %(message)s')
-    logger_date_format: str = field(default='%Y-%m-%d %H:%M:%S')
+    logger_text_format: str = field(default=DEFAULT_TEXT_FORMAT)
+    logger_date_format: str = field(default=DEFAULT_DATE_FORMAT)
+    logger_async: bool = field(default=False)
+    logger_queue_size: int = field(default=10000)
+    logger_overflow: str = field(default='block')
+    logger_handler: Optional[logging.Handler] = field(default=None)
+    logger_json: bool = field(default=False)
 
     #: Not visible
     __logger: Optional[logging.Logger] = field(default=None, init=False, repr=False)
@@ -39,6 +44,10 @@ class CommonLogLineBase:
         },
         init=False, repr=False
     )
+    #: cache of enabled levels, {level: bool}
+    __enabled: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    __enabled_level: int = field(default=-1, init=False, repr=False, compare=False)
+    __enabled_disable: int = field(default=-1, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Post init tasks"""
@@ -66,16 +75,27 @@ class CommonLogLineBase:
 
     def init_logger(self) -> None:
         """initialize logger"""
-        self.__logger = common_logger(name=None, level='INFO')
+        self.__logger = common_logger(
+            name=self.logger_name,
+            level=self.logger_level,
+            text_format=self.logger_text_format,
+            date_format=self.logger_date_format,
+            async_mode=self.logger_async,
+            queue_size=self.logger_queue_size,
+            overflow=self.logger_overflow,
+            handler=self.logger_handler,
+            json_format=self.logger_json
+        )
 
     @staticmethod
-    def __prepare_text(text: str, qualname: str | None) -> str:
+    def __prepare_text(text: str | Callable[[], str], qualname: str | None, args: tuple) -> str:
         """
         add additional qualname string to text
 
         Attr:
-            text (str): string to log
+            text (str|callable): string to log, or callable without arguments returning string
             qualname (str): string to add to text, qualname as in *.__qualname__
+            args (tuple): %-style arguments for text, merged by logging only when record is emitted
         Returns:
             str
         """
@@ -83,94 +103,177 @@ class CommonLogLineBase:
         if qualname is not None and not isinstance(qualname, str):
             raise TypeError(f"Expected 'qualname' to be of type 'str', got {type(qualname).__name__}")
 
+        if callable(text):
+            text = text()
+
         if not isinstance(text, str):
             raise TypeError(f"Expected 'text' to be of type 'str', got {type(text).__name__}")
 
-        return f'{text}' if qualname is None else f'{qualname}: {text}'
+        if qualname is None:
+            return text
+
+        #: qualname is part of %-style template when arguments are provided
+        if args and '%' in qualname:
+            qualname = qualname.replace('%', '%%')
+
+        return f'{qualname}: {text}'
+
+    @property
+    def logger(self) -> logging.Logger:
+        """Logger used by instance"""
+        return self.__logger
 
-    def debug(self, text: str, qualname: str) -> None:
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        check if record of provided level would be emitted by logger
+
+        Result is cached per level, cache is invalidated when level of logger
+        or logging.disable() level changes
+
+        Attr:
+            level (int): one of logging levels
+
+        Returns:
+            bool
+        """
+        logger = self.__logger
+        if logger.level != self.__enabled_level or logger.manager.disable != self.__enabled_disable:
+            self.__enabled.clear()
+            self.__enabled_level = logger.level
+            self.__enabled_disable = logger.manager.disable
+
+        try:
+            return self.__enabled[level]
+        except KeyError:
+            enabled = self.__enabled[level] = logger.isEnabledFor(level)
+            return enabled
+
+    def _log(
+            self, level: int, text: str | Callable[[], str], qualname: str | None, args: tuple, extra: dict
+    ) -> None:
+        """
+        build text and log it, called only when level is enabled
+
+        Must be called directly from public logging method, record points to its caller
+
+        With logger_json qualname is logged as separate field instead of text prefix
+        """
+        if self.logger_json:
+            if qualname is not None:
+                extra['qualname'] = qualname
+            text = self.__prepare_text(text, None, args)
+        else:
+            text = self.__prepare_text(text, qualname, args)
+
+        self.__logger.log(level, text, *args, extra=extra or None, stacklevel=3)
+
+    def debug(self, text: str | Callable[[], str], qualname: str | None = None, *args, **extra) -> None:
         """
         log provided text with logging.Logger as debug line
 
+        Text is built only if debug level is enabled
+
         Attr:
-            text (str): string to log
+            text (str|callable): string to log, can contain %-style placeholders for args,
+                                 or callable without arguments returning string
             qualname (str): string to add to text, qualname as in *.__qualname__
+                            default = None
+            *args: arguments merged into text by logging, only when line is emitted
+            **extra: extra fields of record, rendered as JSON fields with logger_json
 
         Returns:
             None
         """
-
-        text = self.__prepare_text(text, qualname)
-        self.__logger.debug(text)
+        if self.is_enabled_for(logging.DEBUG):
+            self._log(logging.DEBUG, text, qualname, args, extra)
 
         return
 
-    def info(self, text: str, qualname: str | None = None) -> None:
+    def info(self, text: str | Callable[[], str], qualname: str | None = None, *args, **extra) -> None:
         """
         log provided text with logging.Logger as info line
 
+        Text is built only if info level is enabled
+
         Attr:
-            text (str): string to log
+            text (str|callable): string to log, can contain %-style placeholders for args,
+                                 or callable without arguments returning string
             qualname (str): string to add to text, qualname as in *.__qualname__
                             default = None
+            *args: arguments merged into text by logging, only when line is emitted
+            **extra: extra fields of record, rendered as JSON fields with logger_json
 
         Returns:
             None
         """
-        text = self.__prepare_text(text, qualname)
-        self.__logger.info(text)
+        if self.is_enabled_for(logging.INFO):
+            self._log(logging.INFO, text, qualname, args, extra)
 
         return
 
-    def warning(self, text: str, qualname: str) -> None:
+    def warning(self, text: str | Callable[[], str], qualname: str | None = None, *args, **extra) -> None:
         """
         log provided text with logging.Logger as warning line
 
+        Text is built only if warning level is enabled
+
         Attr:
-            text (str): string to log
+            text (str|callable): string to log, can contain %-style placeholders for args,
+                                 or callable without arguments returning string
             qualname (str): string to add to text, qualname as in *.__qualname__
                             default = None
+            *args: arguments merged into text by logging, only when line is emitted
+            **extra: extra fields of record, rendered as JSON fields with logger_json
 
         Returns:
             None
         """
-
-        text = self.__prepare_text(text, qualname)
-        self.__logger.warning(text)
+        if self.is_enabled_for(logging.WARNING):
+            self._log(logging.WARNING, text, qualname, args, extra)
 
         return
 
-    def error(self, text: str, qualname: str) -> None:
+    def error(self, text: str | Callable[[], str], qualname: str | None = None, *args, **extra) -> None:
         """
         log provided text with logging.Logger as error line
 
+        Text is built only if error level is enabled
+
         Attr:
-            text (str): string to log
+            text (str|callable): string to log, can contain %-style placeholders for args,
+                                 or callable without arguments returning string
             qualname (str): string to add to text, qualname as in *.__qualname__
                             default = None
+            *args: arguments merged into text by logging, only when line is emitted
+            **extra: extra fields of record, rendered as JSON fields with logger_json
 
         Returns:
             None
         """
-        text = self.__prepare_text(text, qualname)
-        self.__logger.error(text)
+        if self.is_enabled_for(logging.ERROR):
+            self._log(logging.ERROR, text, qualname, args, extra)
 
         return
 
-    def critical(self, text: str, qualname: str) -> None:
+    def critical(self, text: str | Callable[[], str], qualname: str | None = None, *args, **extra) -> None:
         """
         log provided text with logging.Logger as critical line
 
+        Text is built only if critical level is enabled
+
         Attr:
-            text (str): string to log
+            text (str|callable): string to log, can contain %-style placeholders for args,
+                                 or callable without arguments returning string
             qualname (str): string to add to text, qualname as in *.__qualname__
                             default = None
+            *args: arguments merged into text by logging, only when line is emitted
+            **extra: extra fields of record, rendered as JSON fields with logger_json
 
         Returns:
             None
         """
-        text = self.__prepare_text(text, qualname)
-        self.__logger.critical(text)
+        if self.is_enabled_for(logging.CRITICAL):
+            self._log(logging.CRITICAL, text, qualname, args, extra)
 
         return
 
@@ -0,0 +1,241 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import logging
+import threading
+
+from collections import deque
+from logging import Handler, LogRecord
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+__all__ = (
+    'CommonLogQueueHandler',
+    'OVERFLOW_POLICIES',
+)
+
+OVERFLOW_POLICIES: tuple = ('block', 'drop_oldest', 'drop_newest', 'sample')
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+class CommonLogQueueHandler(Handler):
+    """
+    Handler putting records to bounded queue, records are written by background writer thread
+    to target handler, so logging thread is not blocked by slow output
+
+    Overflow policies, used when queue is full:
+      - block: wait until writer makes space in queue
+      - drop_oldest: oldest queued record is dropped
+      - drop_newest: new record is dropped
+      - sample: every "sample_every"-th overflowing record replaces oldest queued record,
+                others are dropped
+
+    Queue is drained by flush(), which is called by logging.shutdown() at interpreter exit.
+
+    Exceptions:
+        TypeError, ValueError: raised by __init__() on wrong arguments
+    """
+
+    def __init__(
+            self,
+            target: Handler,
+            max_size: int = 10000,
+            overflow: str = 'block',
+            sample_every: int = 10,
+            level: int = logging.NOTSET
+    ):
+        """
+        Parameters:
+            target (Handler):
+                handler used by writer thread to write records
+            max_size (int):
+                maximum count of records waiting in queue
+            overflow (str):
+                one of ['block', 'drop_oldest', 'drop_newest', 'sample']
+            sample_every (int):
+                used by 'sample' overflow policy
+            level (int):
+                level of handler
+        """
+        super().__init__(level)
+
+        if not isinstance(target, Handler):
+            raise TypeError(f'Expected "target" to be of type "Handler", got {type(target).__name__}')
+
+        self.target = target
+        self.max_size = max_size
+        self.overflow = overflow
+        self.sample_every = sample_every
+
+        #: counters
+        self.dropped: int = 0
+        self.written: int = 0
+        self.__overflowed: int = 0
+
+        self.__queue: deque = deque()
+        self.__writing: int = 0
+        self.__stopped: bool = False
+        self.__condition = threading.Condition(threading.Lock())
+        self.__thread = threading.Thread(
+            target=self.__run, name=f'{self.__class__.__name__}-writer', daemon=True
+        )
+        self.__thread.start()
+
+    def __setattr__(self, name, value):
+        """checking values of queue configuration"""
+
+        if name in ('max_size', 'sample_every'):
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise TypeError(f'Expected "{name}" to be of type "int", got {type(value).__name__}')
+            if value < 1:
+                raise ValueError(f'Expected "{name}" to be greater than 0, got {value}')
+
+        elif name == 'overflow':
+            if value not in OVERFLOW_POLICIES:
+                raise ValueError(f'Expected "{name}" to be one of {list(OVERFLOW_POLICIES)}, got {value!r}')
+
+        super().__setattr__(name, value)
+
+    @property
+    def queued(self) -> int:
+        """count of records waiting in queue"""
+        return len(self.__queue)
+
+    def stats(self) -> dict:
+        """
+        snapshot of queue counters
+
+        Returns:
+            dict: {'queued': int, 'written': int, 'dropped': int}
+        """
+        return {'queued': self.queued, 'written': self.written, 'dropped': self.dropped}
+
+    def wait_for_space(self, timeout: float | None = None) -> bool:
+        """
+        wait until queue is not full
+
+        Parameters:
+            timeout (float): maximum time to wait in seconds, None waits without limit
+        Returns:
+            bool: False if timeout elapsed and queue is still full
+        """
+        with self.__condition:
+            return self.__condition.wait_for(
+                lambda: len(self.__queue) < self.max_size or self.__stopped, timeout
+            )
+
+    @staticmethod
+    def prepare(record: LogRecord) -> LogRecord:
+        """
+        merge message with arguments and render exception text in logging thread,
+        record can be then safely handled by writer thread
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+    def emit(self, record: LogRecord) -> None:
+        """put record to queue, apply overflow policy if queue is full"""
+
+        try:
+            record = self.prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        with self.__condition:
+            if self.__stopped:
+                self.dropped += 1
+                return
+
+            if len(self.__queue) >= self.max_size:
+                match self.overflow:
+                    case 'block':
+                        while len(self.__queue) >= self.max_size and not self.__stopped:
+                            self.__condition.wait()
+                    case 'drop_newest':
+                        self.dropped += 1
+                        return
+                    case 'drop_oldest':
+                        self.__queue.popleft()
+                        self.dropped += 1
+                    case 'sample':
+                        self.__overflowed += 1
+                        self.dropped += 1
+                        if self.__overflowed % self.sample_every:
+                            return
+                        self.__queue.popleft()
+
+            self.__queue.append(record)
+            self.__condition.notify_all()
+
+    def __run(self) -> None:
+        """writer thread, writes queued records in batches to target handler"""
+
+        while True:
+            with self.__condition:
+                while not self.__queue and not self.__stopped:
+                    self.__condition.wait()
+
+                if not self.__queue and self.__stopped:
+                    return
+
+                batch = self.__queue
+                self.__queue = deque()
+                self.__writing = len(batch)
+                self.__condition.notify_all()
+
+            for record in batch:
+                try:
+                    self.target.handle(record)
+                except Exception:
+                    self.handleError(record)
+
+            with self.__condition:
+                self.written += self.__writing
+                self.__writing = 0
+                self.__condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> None:
+        """
+        wait until all queued records are written by writer thread, then flush target
+
+        Parameters:
+            timeout (float): maximum time to wait in seconds, None waits without limit
+        """
+        if threading.current_thread() is not self.__thread:
+            with self.__condition:
+                self.__condition.wait_for(
+                    lambda: (not self.__queue and not self.__writing) or not self.__thread.is_alive(),
+                    timeout
+                )
+        self.target.flush()
+
+    def close(self) -> None:
+        """drain queue and stop writer thread"""
+
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify_all()
+
+        if threading.current_thread() is not self.__thread:
+            self.__thread.join()
+
+        self.target.flush()
+        super().close()
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
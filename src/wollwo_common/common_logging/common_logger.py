@@ -7,81 +7,241 @@ License: MIT
 #: ------------------------------------------------ IMPORTS ------------------------------------------------
 import logging
 import sys
+import threading
 
-from logging import Logger
-from typing import Union
+from logging import Handler, Logger
+
+from .common_log_formatter import CommonLogFormatter
+from .common_log_json import CommonLogJsonFormatter
+from .common_log_queue import CommonLogQueueHandler, OVERFLOW_POLICIES
 
 #: ----------------------------------------------- VARIABLES -----------------------------------------------
 __all__ = (
-    'common_logger'
+    'common_logger',
+    'DEFAULT_TEXT_FORMAT',
+    'DEFAULT_DATE_FORMAT',
 )
 
+DEFAULT_TEXT_FORMAT: str = '%(asctime)s; %(name)s; %(message)s'
+DEFAULT_DATE_FORMAT: str = '%Y-%m-%d %H:%M:%S'
+
+#: Prepare expected values
+_EXPECTED_INT_VALUES: tuple = (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+_EXPECTED_STRING_VALUES: dict = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+#: Registry of configured loggers, {(name, level, text_format, date_format, ...): Logger}
+_LOGGER_REGISTRY: dict[tuple, Logger] = {}
+#: Resolved configuration of each configured logger, {name: (level, text_format, date_format, ...)}
+_LOGGER_CONFIGS: dict[str, tuple] = {}
+#: Output handler owned by common_logger for each configured logger, {name: Handler}
+_LOGGER_HANDLERS: dict[str, Handler] = {}
+#: Queue handler in front of output handler for loggers in async mode, {name: CommonLogQueueHandler}
+_LOGGER_QUEUES: dict[str, CommonLogQueueHandler] = {}
+_REGISTRY_LOCK = threading.RLock()
+
 
 #: ------------------------------------------------- CLASS -------------------------------------------------
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler writing always to current sys.stdout, even if it was redirected after creation"""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
 
 
 #: ------------------------------------------------ METHODS ------------------------------------------------
-def common_logger(name: str | None = None, level: str | int = 'INFO') -> Logger:
+def _resolve_name(name: str | int | None) -> str:
     """
-    Creates and returns custom instance of Logger object
+    Check NAME argument is correct type
 
-    Args:
-        name (str): Provide name of Logger.
-                    Default value is "common_logger"
-        level (str|int): Provide one of ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'] or
-                         [logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL]
     Returns:
-        Logger: Logger class instance
+        str: logger name
     """
-    #: Prepare expected values
-    expected_int_values = [logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL]
-    expected_string_values = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL,
-    }
-
-    #: Check NAME argument is correct type
     if name is None:
-        name = 'common_logger'
+        return 'common_logger'
     elif isinstance(name, int):
-        name = str(name)
+        return str(name)
     elif not isinstance(name, str):
         raise TypeError(f'Provided argument "name" is not str, provided: {type(name)}')
 
-    #: Check LEVEL argument is correct type or value
+    return name
+
+
+def _resolve_level(level: str | int) -> int:
+    """
+    Check LEVEL argument is correct type or value
+
+    Returns:
+        int: logging level
+    """
     if isinstance(level, str):
-        level: int | None = expected_string_values.get(level.lower(), None)
+        resolved: int | None = _EXPECTED_STRING_VALUES.get(level.lower(), None)
 
-        if level is None:
+        if resolved is None:
             raise ValueError(
-                f'Wrong str value was provided for "level", must be one of {str(list(expected_string_values.keys()))}'
+                f'Wrong str value was provided for "level", must be one of {str(list(_EXPECTED_STRING_VALUES.keys()))}'
             )
+        return resolved
 
-    elif isinstance(level, int) and level not in expected_int_values:
+    elif isinstance(level, int) and level not in _EXPECTED_INT_VALUES:
         raise ValueError(
-            f'Wrong int value was provided for "level", must be one of {str(expected_int_values)}'
+            f'Wrong int value was provided for "level", must be one of {str(list(_EXPECTED_INT_VALUES))}'
         )
 
     elif not isinstance(level, (str, int)):
         raise TypeError(f'Provided argument "level" is not str or int, provided: {type(level)}')
 
-    #: Preparing Logger instance
-    logger = logging.getLogger(name)
+    return level
+
+
+def _configure_logger(
+        logger: Logger,
+        level: int,
+        text_format: str,
+        date_format: str,
+        async_mode: bool,
+        queue_size: int,
+        overflow: str,
+        handler: Handler | None,
+        json_format: bool
+) -> None:
+    """
+    (re)configure level and handlers of logger in place, caller holds _REGISTRY_LOCK
+    """
     logger.setLevel(level)
 
-    #: Create a console handler
-    handler = logging.StreamHandler(sys.stdout)
+    #: Output handler, provided one or console handler created before
+    previous = _LOGGER_HANDLERS.get(logger.name)
+    if handler is None:
+        handler = previous if isinstance(previous, _StdoutHandler) else _StdoutHandler()
+    if previous is not None and previous is not handler:
+        logger.removeHandler(previous)
+        previous.flush()
+    _LOGGER_HANDLERS[logger.name] = handler
     handler.setLevel(level)
 
     #: Define the log format
-    formatter = logging.Formatter('%(asctime)s; %(name)s; %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-    handler.setFormatter(formatter)
+    if json_format:
+        handler.setFormatter(CommonLogJsonFormatter(datefmt=date_format))
+    else:
+        handler.setFormatter(CommonLogFormatter(text_format, datefmt=date_format))
+
+    #: In async mode records pass through queue handler in front of output handler
+    queue_handler = _LOGGER_QUEUES.get(logger.name)
+    if async_mode:
+        if queue_handler is None:
+            queue_handler = CommonLogQueueHandler(handler, max_size=queue_size, overflow=overflow)
+            _LOGGER_QUEUES[logger.name] = queue_handler
+        else:
+            queue_handler.flush()
+            queue_handler.target = handler
+            queue_handler.max_size = queue_size
+            queue_handler.overflow = overflow
+        queue_handler.setLevel(level)
+        logger.removeHandler(handler)
+        handler = queue_handler
+    elif queue_handler is not None:
+        logger.removeHandler(queue_handler)
+        queue_handler.flush()
 
     #: Add the handler to the logger
-    logger.addHandler(handler)
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
+
+
+def common_logger(
+        name: str | None = None,
+        level: str | int = 'INFO',
+        text_format: str = DEFAULT_TEXT_FORMAT,
+        date_format: str = DEFAULT_DATE_FORMAT,
+        async_mode: bool = False,
+        queue_size: int = 10000,
+        overflow: str = 'block',
+        handler: Handler | None = None,
+        json_format: bool = False
+) -> Logger:
+    """
+    Creates and returns custom instance of Logger object
+
+    Loggers are cached by (name, level, format), repeated calls with the same
+    configuration return the cached Logger without touching its handlers.
+    Calling again with different configuration reconfigures the existing
+    handler in place, so each logger never owns more than one output handler.
+
+    Args:
+        name (str): Provide name of Logger.
+                    Default value is "common_logger"
+        level (str|int): Provide one of ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'] or
+                         [logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL]
+        text_format (str): format of logged line, as in logging.Formatter,
+                           compiled once by CommonLogFormatter
+        date_format (str): format of %(asctime)s, as in logging.Formatter
+        async_mode (bool): records are put to bounded queue and written by background thread,
+                           see CommonLogQueueHandler
+        queue_size (int): maximum count of records waiting in queue, used with async_mode
+        overflow (str): one of ['block', 'drop_oldest', 'drop_newest', 'sample'],
+                        what to do when queue is full, used with async_mode
+        handler (Handler): output handler used instead of console handler writing to sys.stdout,
+                           e.g. CommonLogBatchHandler, level and format are applied to it
+        json_format (bool): lines are rendered as JSON by CommonLogJsonFormatter,
+                            text_format is not used
+    Returns:
+        Logger: Logger class instance
+    """
+    #: Fast path, already configured logger
+    call_key = (name, level, text_format, date_format, async_mode, queue_size, overflow, handler, json_format)
+    try:
+        logger = _LOGGER_REGISTRY.get(call_key)
+    except TypeError:
+        logger = None
+    if logger is not None:
+        return logger
+
+    resolved_name = _resolve_name(name)
+    resolved_level = _resolve_level(level)
+
+    if not isinstance(text_format, str):
+        raise TypeError(f'Provided argument "text_format" is not str, provided: {type(text_format)}')
+    if not isinstance(date_format, str):
+        raise TypeError(f'Provided argument "date_format" is not str, provided: {type(date_format)}')
+    if not isinstance(async_mode, bool):
+        raise TypeError(f'Provided argument "async_mode" is not bool, provided: {type(async_mode)}')
+    if not isinstance(queue_size, int) or isinstance(queue_size, bool):
+        raise TypeError(f'Provided argument "queue_size" is not int, provided: {type(queue_size)}')
+    if queue_size < 1:
+        raise ValueError('Wrong value was provided for "queue_size", must be greater than 0')
+    if overflow not in OVERFLOW_POLICIES:
+        raise ValueError(f'Wrong value was provided for "overflow", must be one of {str(list(OVERFLOW_POLICIES))}')
+
+    if not isinstance(json_format, bool):
+        raise TypeError(f'Provided argument "json_format" is not bool, provided: {type(json_format)}')
+    if handler is not None and not isinstance(handler, Handler):
+        raise TypeError(f'Provided argument "handler" is not Handler, provided: {type(handler)}')
+
+    with _REGISTRY_LOCK:
+        #: Preparing Logger instance
+        logger = logging.getLogger(resolved_name)
+        config = (resolved_level, text_format, date_format, async_mode, queue_size, overflow, handler, json_format)
+
+        if _LOGGER_CONFIGS.get(resolved_name) != config:
+            _configure_logger(logger, *config)
+
+            #: drop cached calls pointing to previous configuration of this logger
+            for key in [key for key, value in _LOGGER_REGISTRY.items() if value is logger]:
+                del _LOGGER_REGISTRY[key]
+            _LOGGER_CONFIGS[resolved_name] = config
+
+        _LOGGER_REGISTRY[call_key] = logger
 
     return logger
 
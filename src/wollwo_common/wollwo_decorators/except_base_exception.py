@@ -44,6 +44,7 @@ class ExceptBaseException:
             provide exit code, from 0-255
             If value is provided, exception will exit with provided code
             if not None, silence_exc will not be executed
+            handlers of custom_logger are flushed before exit
         print_trace (bool): Default True
             will print traceback before raisin/exiting/silencing exception
             print trace just before exit or silence
@@ -141,6 +142,7 @@ class ExceptBaseException:
                         'error',
                         f'{exc_type.__name__}: Exiting with {self.exit_on_exc}'
                     )
+                    self.__flush_logger()
                     sys.exit(self.exit_on_exc)
 
                 #: silence or raise if not passed
@@ -225,6 +227,19 @@ class ExceptBaseException:
 
         return
 
+    def __flush_logger(self) -> None:
+        """
+        flush handlers of custom_logger, so queued/buffered records are written before exit
+        """
+        if self.custom_logger is None:
+            return
+
+        for handler in self.custom_logger.handlers:
+            try:
+                handler.flush()
+            except Exception:
+                pass
+
     def __print_traceback(self, exc_type, exc_value, traceback_obj):
         """
         print captured traceback
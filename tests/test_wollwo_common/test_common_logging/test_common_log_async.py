@@ -0,0 +1,98 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import asyncio
+import logging
+import threading
+import pytest
+
+from wollwo_common.common_logging import AsyncCommonLogLine, CommonLogQueueHandler
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+class BlockedHandler(logging.Handler):
+    """Handler collecting messages and thread names, blocked until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages: list = []
+        self.threads: set = set()
+        self.release = threading.Event()
+
+    def emit(self, record):
+        self.release.wait(5)
+        self.threads.add(threading.current_thread().name)
+        self.messages.append(self.format(record))
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+def test_async_common_log_line_writes_from_writer_thread():
+    """
+    records are written by writer thread and drained on exit of async context manager
+    """
+    handler = BlockedHandler()
+    handler.release.set()
+
+    async def main():
+        async with AsyncCommonLogLine('test_async_common_log_line', logger_handler=handler,
+                                      logger_text_format='%(levelname)s %(message)s') as log:
+            assert isinstance(log.logger.handlers[0], CommonLogQueueHandler)
+            for i in range(5):
+                await log.ainfo('value %d', 'main', i)
+            await log.adebug('hidden', 'main')
+            await log.aerror('failed', 'main')
+
+    asyncio.run(main())
+
+    assert handler.messages == [f'INFO main: value {i}' for i in range(5)] + ['ERROR main: failed']
+    assert threading.current_thread().name not in handler.threads
+
+
+def test_async_common_log_line_does_not_block_loop():
+    """
+    slow output and full queue do not block event loop
+    """
+    handler = BlockedHandler()
+
+    async def ticker(ticks: list):
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0.001)
+
+    async def main():
+        log = AsyncCommonLogLine('test_async_common_log_line_blocked', logger_handler=handler,
+                                 logger_queue_size=2)
+        ticks: list = []
+        task = asyncio.create_task(ticker(ticks))
+
+        writers = asyncio.gather(*(log.ainfo(f'line {i}') for i in range(5)))
+        await asyncio.sleep(0.05)
+        assert ticks, 'event loop was blocked'
+        assert not writers.done()
+
+        handler.release.set()
+        await writers
+        await log.drain()
+        task.cancel()
+
+    asyncio.run(main())
+    assert len(handler.messages) == 5
+
+
+def test_async_common_log_line_requires_async_mode():
+    """
+    logger_async=False is refused
+    """
+    with pytest.raises(ValueError):
+        AsyncCommonLogLine('test_async_common_log_line_sync', logger_async=False)
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
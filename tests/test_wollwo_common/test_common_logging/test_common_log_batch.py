@@ -0,0 +1,131 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import logging
+import os
+import time
+import pytest
+
+from wollwo_common import common_logger
+from wollwo_common.common_logging import CommonLogBatchHandler
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+@pytest.fixture
+def pipe():
+    """non blocking read end and write end of pipe"""
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def read(fd: int) -> bytes:
+    """read everything available in pipe"""
+    try:
+        return os.read(fd, 1 << 20)
+    except BlockingIOError:
+        return b''
+
+
+def make_record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    """create simple LogRecord"""
+    return logging.LogRecord('test', level, __file__, 0, msg, None, None)
+
+
+def test_batch_handler_buffers_until_flush(pipe):
+    """
+    lines are written only on flush
+    """
+    read_fd, write_fd = pipe
+    handler = CommonLogBatchHandler(write_fd, flush_interval=None)
+
+    for i in range(3):
+        handler.handle(make_record(f'line {i}'))
+    assert read(read_fd) == b''
+    assert handler.buffered == 21
+
+    handler.flush()
+    assert read(read_fd) == b'line 0\nline 1\nline 2\n'
+    handler.close()
+
+
+def test_batch_handler_flush_level(pipe):
+    """
+    record of flush_level is written immediately with buffered lines
+    """
+    read_fd, write_fd = pipe
+    handler = CommonLogBatchHandler(write_fd, flush_interval=None)
+
+    handler.handle(make_record('info'))
+    handler.handle(make_record('error', logging.ERROR))
+
+    assert read(read_fd) == b'info\nerror\n'
+    handler.close()
+
+
+def test_batch_handler_buffer_size(pipe):
+    """
+    full buffer is written, lines longer than buffer are written directly
+    """
+    read_fd, write_fd = pipe
+    handler = CommonLogBatchHandler(write_fd, buffer_size=8, flush_interval=None)
+
+    handler.handle(make_record('abc'))
+    handler.handle(make_record('defg'))
+    assert read(read_fd) == b'abc\n'
+
+    handler.handle(make_record('long line'))
+    assert read(read_fd) == b'defg\nlong line\n'
+    assert handler.buffered == 0
+    handler.close()
+
+
+def test_batch_handler_flush_interval(pipe):
+    """
+    timer thread writes lines waiting longer than flush_interval
+    """
+    read_fd, write_fd = pipe
+    handler = CommonLogBatchHandler(write_fd, flush_interval=0.05)
+
+    handler.handle(make_record('line'))
+    deadline = time.monotonic() + 5
+    data = b''
+    while not data and time.monotonic() < deadline:
+        time.sleep(0.01)
+        data = read(read_fd)
+
+    assert data == b'line\n'
+    handler.close()
+
+
+def test_batch_handler_with_common_logger(pipe):
+    """
+    common_logger applies format to provided handler
+    """
+    read_fd, write_fd = pipe
+    handler = CommonLogBatchHandler(write_fd, flush_interval=None)
+    logger = common_logger('test_batch_handler_with_common_logger', 'INFO', text_format='%(levelname)s %(message)s',
+                           handler=handler)
+
+    assert logger.handlers == [handler]
+    logger.info('line')
+    handler.flush()
+
+    assert read(read_fd) == b'INFO line\n'
+    handler.close()
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,89 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import logging
+import sys
+import pytest
+
+from wollwo_common.common_logging import CommonLogFormatter
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+FORMATS = [
+    '%(asctime)s; %(name)s; %(message)s',
+    '%(levelname)-8s|%(levelno)03d|%(name)r|%(message)s 100%%',
+    '{%(process)d} \'%(funcName)s\' %(lineno)d %(relativeCreated).1f: %(message)s',
+    '%(message)s',
+]
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+def make_record(msg: str = 'value %d', args: tuple = (5,), exc_info=None) -> logging.LogRecord:
+    """create LogRecord"""
+    return logging.LogRecord('test.logger', logging.WARNING, __file__, 12, msg, args, exc_info, func='method')
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+@pytest.mark.parametrize('datefmt', [None, '%Y-%m-%d %H:%M:%S', '%H:%M'])
+def test_common_log_formatter_same_as_logging(fmt, datefmt):
+    """
+    compiled formatter renders same lines as logging.Formatter
+    """
+    record = make_record()
+    assert CommonLogFormatter(fmt, datefmt).format(record) == logging.Formatter(fmt, datefmt).format(record)
+
+
+def test_common_log_formatter_exception():
+    """
+    exception text is appended as by logging.Formatter
+    """
+    try:
+        raise ValueError('broken')
+    except ValueError:
+        exc_info = sys.exc_info()
+
+    text = CommonLogFormatter('%(message)s').format(make_record(exc_info=exc_info))
+    assert text == logging.Formatter('%(message)s').format(make_record(exc_info=exc_info))
+    assert text.count('Traceback') == 1
+    assert text.endswith('ValueError: broken')
+
+
+def test_common_log_formatter_time_cached():
+    """
+    timestamp is rendered once per second
+    """
+    formatter = CommonLogFormatter('%(asctime)s', '%S')
+    record1, record2 = make_record(), make_record()
+    record1.created = 100.1
+    record2.created = 100.9
+
+    assert formatter.format(record1) == formatter.format(record2)
+
+    record2.created = 101.0
+    assert formatter.format(record1) != formatter.format(record2)
+
+
+def test_common_log_formatter_missing_field():
+    """
+    missing field raise ValueError as in logging.Formatter
+    """
+    with pytest.raises(ValueError):
+        CommonLogFormatter('%(missing)s').format(make_record())
+
+
+def test_common_log_formatter_other_style():
+    """
+    '{' style is handled by logging.Formatter
+    """
+    assert CommonLogFormatter('{levelname}: {message}', style='{').format(make_record()) == 'WARNING: value 5'
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
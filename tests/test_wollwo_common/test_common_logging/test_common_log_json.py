@@ -0,0 +1,83 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import json
+import logging
+import sys
+
+from wollwo_common import CommonLogLineBase
+from wollwo_common.common_logging import CommonLogJsonFormatter
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+def make_record(msg: str, args: tuple = (), exc_info=None) -> logging.LogRecord:
+    """create LogRecord"""
+    return logging.LogRecord('test.json', logging.WARNING, __file__, 12, msg, args, exc_info)
+
+
+def test_json_formatter_valid_json():
+    """
+    lines are valid JSON, strings are escaped
+    """
+    record = make_record('quote " backslash \\ newline \n unicode ž %s', ('arg',))
+    record.created = 0.0
+    record.msecs = 0.0
+
+    line = CommonLogJsonFormatter(datefmt='%Y').format(record)
+    assert json.loads(line) == {
+        'ts': '1970',
+        'level': 'WARNING',
+        'name': 'test.json',
+        'msg': 'quote " backslash \\ newline \n unicode ž arg',
+    }
+
+
+def test_json_formatter_extra_and_exception():
+    """
+    extra attributes and exception are rendered as fields
+    """
+    try:
+        raise ValueError('broken')
+    except ValueError:
+        record = make_record('failed', exc_info=sys.exc_info())
+    record.qualname = 'Test.method'
+    record.request_id = 'abc'
+    record.count = 3
+    record.ratio = 0.5
+    record.flag = None
+    record.items = [1, 'two']
+
+    data = json.loads(CommonLogJsonFormatter().format(record))
+    assert data['qualname'] == 'Test.method'
+    assert (data['request_id'], data['count'], data['ratio'], data['flag'], data['items']) == (
+        'abc', 3, 0.5, None, [1, 'two']
+    )
+    assert data['exc'].endswith('ValueError: broken')
+
+
+def test_common_log_line_json(capsys):
+    """
+    CommonLogLineBase logs qualname and extra as separate fields
+    """
+    log_line = CommonLogLineBase('test_common_log_line_json', logger_json=True)
+    log_line.info('value %d', 'Test.method', 5, request_id='abc')
+
+    data = json.loads(capsys.readouterr().out)
+    assert data['name'] == 'test_common_log_line_json'
+    assert data['qualname'] == 'Test.method'
+    assert data['msg'] == 'value 5'
+    assert data['request_id'] == 'abc'
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,85 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import logging
+import pytest
+
+from wollwo_common import CommonLogLineBase
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+def test_common_log_line_lazy_args(capsys):
+    """
+    %-style args are merged only into emitted lines
+    """
+    log_line = CommonLogLineBase('test_common_log_line_lazy_args', logger_text_format='%(levelname)s|%(message)s')
+
+    log_line.info('value %d of %s', 'Test.method', 5, 'five')
+    log_line.info('no args 100%')
+    log_line.debug('value %d', 'Test.method', 6)
+
+    assert capsys.readouterr().out == 'INFO|Test.method: value 5 of five\nINFO|no args 100%\n'
+
+
+def test_common_log_line_disabled_level_not_formatted(capsys):
+    """
+    callable text is not called for disabled level
+    """
+    calls = []
+
+    def build_text() -> str:
+        calls.append(1)
+        return 'expensive'
+
+    log_line = CommonLogLineBase('test_common_log_line_disabled_level', logger_text_format='%(message)s')
+
+    log_line.debug(build_text, 'Test')
+    assert calls == []
+
+    log_line.warning(build_text, 'Test')
+    assert calls == [1]
+    assert capsys.readouterr().out == 'Test: expensive\n'
+
+
+def test_common_log_line_enabled_cache_invalidated(capsys):
+    """
+    change of logger level is visible in cached enabled flags
+    """
+    log_line = CommonLogLineBase('test_common_log_line_enabled_cache', logger_text_format='%(message)s')
+    assert not log_line.is_enabled_for(logging.DEBUG)
+
+    logging.getLogger('test_common_log_line_enabled_cache').setLevel(logging.DEBUG)
+    assert log_line.is_enabled_for(logging.DEBUG)
+
+    logging.getLogger('test_common_log_line_enabled_cache').setLevel(logging.INFO)
+    assert not log_line.is_enabled_for(logging.DEBUG)
+
+
+def test_common_log_line_wrong_types():
+    """
+    wrong types of text or qualname raise
+    """
+    log_line = CommonLogLineBase('test_common_log_line_wrong_types')
+
+    with pytest.raises(TypeError):
+        log_line.info(123)
+
+    with pytest.raises(TypeError):
+        log_line.info('text', 123)
+
+    with pytest.raises(TypeError):
+        log_line.info(lambda: 123)
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,137 @@
+"""
+Copyright (c) 2025 by Michal Perzel. All rights reserved.
+
+License: MIT
+"""
+
+#: ------------------------------------------------ IMPORTS ------------------------------------------------
+import logging
+import threading
+import pytest
+
+from wollwo_common import common_logger, ExceptBaseException
+from wollwo_common.common_logging import CommonLogQueueHandler
+
+#: ----------------------------------------------- VARIABLES -----------------------------------------------
+
+
+#: ------------------------------------------------- CLASS -------------------------------------------------
+class SlowHandler(logging.Handler):
+    """Handler collecting messages, blocked until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages: list = []
+        self.release = threading.Event()
+
+    def emit(self, record):
+        self.release.wait(5)
+        self.messages.append(record.getMessage())
+
+
+#: ------------------------------------------------ METHODS ------------------------------------------------
+def make_record(msg: str, *args) -> logging.LogRecord:
+    """create simple LogRecord"""
+    return logging.LogRecord('test', logging.INFO, __file__, 0, msg, args, None)
+
+
+def fill(handler: CommonLogQueueHandler, target: SlowHandler, count: int) -> None:
+    """
+    occupy writer thread with first record, then put "count" records to queue
+    """
+    handler.handle(make_record('first'))
+    while handler.queued:
+        pass
+    for i in range(count):
+        handler.handle(make_record('record %d', i))
+
+
+def test_queue_handler_writes_all_records():
+    """
+    all records are written by writer thread after flush
+    """
+    target = SlowHandler()
+    target.release.set()
+    handler = CommonLogQueueHandler(target)
+
+    for i in range(100):
+        handler.handle(make_record('record %d', i))
+    handler.flush()
+
+    assert target.messages == [f'record {i}' for i in range(100)]
+    assert handler.stats() == {'queued': 0, 'written': 100, 'dropped': 0}
+    handler.close()
+
+
+@pytest.mark.parametrize('overflow, expected, dropped', [
+    ('drop_newest', ['first', 'record 0', 'record 1'], 3),
+    ('drop_oldest', ['first', 'record 3', 'record 4'], 3),
+    ('sample', ['first', 'record 1', 'record 3'], 3),
+])
+def test_queue_handler_overflow(overflow, expected, dropped):
+    """
+    overflow policies keep queue bounded and count dropped records
+    """
+    target = SlowHandler()
+    handler = CommonLogQueueHandler(target, max_size=2, overflow=overflow, sample_every=2)
+
+    fill(handler, target, 5)
+    assert handler.queued == 2
+    assert handler.dropped == dropped
+
+    target.release.set()
+    handler.flush()
+    assert target.messages == expected
+    handler.close()
+
+
+def test_queue_handler_wrong_values():
+    """
+    wrong configuration raise
+    """
+    with pytest.raises(TypeError):
+        CommonLogQueueHandler(None)
+
+    with pytest.raises(ValueError):
+        CommonLogQueueHandler(logging.NullHandler(), overflow='wait')
+
+    with pytest.raises(ValueError):
+        CommonLogQueueHandler(logging.NullHandler(), max_size=0)
+
+
+def test_common_logger_async_mode(capsys):
+    """
+    common_logger in async mode writes lines from writer thread
+    """
+    logger = common_logger('test_common_logger_async_mode', 'INFO', async_mode=True, overflow='drop_oldest')
+    handler = logger.handlers[0]
+    assert isinstance(handler, CommonLogQueueHandler)
+
+    for i in range(10):
+        logger.info('line %d', i)
+    handler.flush()
+
+    assert capsys.readouterr().out.count('line') == 10
+
+    #: switching back to sync mode replaces queue handler
+    logger = common_logger('test_common_logger_async_mode', 'INFO')
+    assert len(logger.handlers) == 1
+    assert not isinstance(logger.handlers[0], CommonLogQueueHandler)
+
+
+def test_except_base_exception_flushes_on_exit(capsys):
+    """
+    queued records are written before sys.exit
+    """
+    logger = common_logger('test_except_base_exception_flushes', 'INFO', async_mode=True)
+
+    with pytest.raises(SystemExit):
+        with ExceptBaseException(custom_logger=logger, exit_on_exc=3, print_trace=False):
+            raise BaseException('exit')
+
+    assert 'Exiting with 3' in capsys.readouterr().out
+
+
+#: ------------------------------------------------- BODY --------------------------------------------------
+if __name__ == '__main__':
+    pass
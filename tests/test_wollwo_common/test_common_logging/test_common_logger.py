@@ -5,7 +5,10 @@ License: MIT
 """
 
 #: ------------------------------------------------ IMPORTS ------------------------------------------------
+import logging
+import pytest
 
+from wollwo_common import common_logger, CommonLogLineBase
 
 #: ----------------------------------------------- VARIABLES -----------------------------------------------
 
@@ -14,6 +17,66 @@ License: MIT
 
 
 #: ------------------------------------------------ METHODS ------------------------------------------------
+def test_common_logger_cached(capsys):
+    """
+    repeated calls return same logger with single handler
+    """
+    logger1 = common_logger('test_common_logger_cached', 'INFO')
+    logger2 = common_logger('test_common_logger_cached', 'INFO')
+
+    assert logger1 is logger2
+    assert len(logger1.handlers) == 1
+
+    logger1.info('line')
+    assert capsys.readouterr().out.count('line') == 1
+
+
+def test_common_logger_reconfigure_in_place(capsys):
+    """
+    new configuration changes existing handler, does not add another one
+    """
+    logger = common_logger('test_common_logger_reconfigure', 'INFO')
+    handler = logger.handlers[0]
+
+    logger = common_logger('test_common_logger_reconfigure', 'DEBUG', text_format='%(levelname)s|%(message)s')
+
+    assert logger.handlers == [handler]
+    assert logger.level == logging.DEBUG
+    assert handler.level == logging.DEBUG
+
+    logger.debug('line')
+    assert capsys.readouterr().out == 'DEBUG|line\n'
+
+    #: previous configuration is applied again, not served from stale cache
+    logger = common_logger('test_common_logger_reconfigure', 'INFO')
+    assert logger.level == logging.INFO
+    assert logger.handlers == [handler]
+
+
+def test_common_logger_wrong_values():
+    """
+    wrong arguments raise
+    """
+    with pytest.raises(TypeError):
+        common_logger(['name'])
+
+    with pytest.raises(ValueError):
+        common_logger('test_common_logger_wrong_values', 'verbose')
+
+    with pytest.raises(ValueError):
+        common_logger('test_common_logger_wrong_values', 15)
+
+
+def test_common_log_line_base_single_handler(capsys):
+    """
+    many CommonLogLineBase instances share one handler, each line is written once
+    """
+    for _ in range(10):
+        log_line = CommonLogLineBase('test_common_log_line_base_single_handler')
+
+    log_line.info('line', 'test')
+
+    assert capsys.readouterr().out.count('test: line') == 1
 
 
 #: ------------------------------------------------- BODY --------------------------------------------------